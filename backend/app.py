@@ -1,71 +1,220 @@
-from flask import Flask, request, jsonify
-from flask_cors import CORS
+import re
+import asyncio
+import httpx
+import orjson
+from quart import Quart, request
+from quart_cors import cors
 import os
 from dotenv import load_dotenv
-from utils.summarizer import generate_summary, analyze_sentiment, generate_coach_feedback, handle_chat
+from utils.openai_batch import submit_analysis_batch, get_analysis_batch_result
+from utils.summarizer import generate_summary, analyze_sentiment, generate_coach_feedback, analyze_meeting, handle_chat, stream_chat, http_client
+from utils.summarizer import serving_mock_data, fallback_answer, mock_summary, mock_sentiment, mock_coaching, mock_answers
 
 load_dotenv()
 
-app = Flask(__name__)
-CORS(app)  # Enable CORS for all routes
+app = Quart(__name__)
+app = cors(app, allow_origin="*")  # Enable CORS for all routes
+
+def json_response(data, status=200):
+    return app.response_class(orjson.dumps(data), status=status, mimetype='application/json')
+
+def raw_response(body):
+    return app.response_class(body, mimetype='application/json')
+
+# Demo-mode responses never change, so they are encoded once at startup
+MOCK_SUMMARY_BYTES = orjson.dumps({'summary': mock_summary, 'status': 'success'})
+MOCK_SENTIMENT_BYTES = orjson.dumps({'sentiment_analysis': mock_sentiment, 'status': 'success'})
+MOCK_COACHING_BYTES = orjson.dumps({'coaching_feedback': mock_coaching, 'status': 'success'})
+MOCK_ANALYSIS_BYTES = orjson.dumps({
+    'summary': mock_summary,
+    'sentiment_analysis': mock_sentiment,
+    'coaching_feedback': mock_coaching,
+    'status': 'success'
+})
+# Keyed by the answer fallback_answer picks, so the question -> answer mapping lives in one place
+MOCK_CHAT_BYTES = {answer: orjson.dumps({'answer': answer, 'status': 'success'}) for answer in mock_answers.values()}
+MOCK_CHAT_STREAM_BYTES = {answer: b'data: ' + orjson.dumps({'content': answer}) + b'\n\ndata: [DONE]\n\n' for answer in mock_answers.values()}
+
+async def read_json():
+    try:
+        return orjson.loads(await request.get_data())
+    except orjson.JSONDecodeError:
+        return {}
+
+@app.after_serving
+async def close_http_client():
+    await http_client.aclose()
 
 @app.route('/api/summarize', methods=['POST'])
-def summarize():
+async def summarize():
     """
     Process transcript and return structured summary
     """
-    data = request.json
+    data = await read_json()
     transcript = data.get('transcript', '')
     
     if not transcript:
-        return jsonify({'error': 'No transcript provided'}), 400
+        return json_response({'error': 'No transcript provided'}, 400)
+    
+    if serving_mock_data():
+        return raw_response(MOCK_SUMMARY_BYTES)
     
-    summary = generate_summary(transcript)
-    return jsonify(summary)
+    summary = await generate_summary(transcript)
+    return json_response(summary)
 
 @app.route('/api/analyze-sentiment', methods=['POST'])
-def sentiment():
+async def sentiment():
     """
     Detect emotional tone throughout meeting
     """
-    data = request.json
+    data = await read_json()
     transcript = data.get('transcript', '')
     
     if not transcript:
-        return jsonify({'error': 'No transcript provided'}), 400
+        return json_response({'error': 'No transcript provided'}, 400)
+    
+    if serving_mock_data():
+        return raw_response(MOCK_SENTIMENT_BYTES)
     
-    sentiment_analysis = analyze_sentiment(transcript)
-    return jsonify(sentiment_analysis)
+    sentiment_analysis = await analyze_sentiment(transcript)
+    return json_response(sentiment_analysis)
 
 @app.route('/api/coach-feedback', methods=['POST'])
-def coach():
+async def coach():
     """
     Generate meeting improvement suggestions
     """
-    data = request.json
+    data = await read_json()
     transcript = data.get('transcript', '')
     
     if not transcript:
-        return jsonify({'error': 'No transcript provided'}), 400
+        return json_response({'error': 'No transcript provided'}, 400)
     
-    feedback = generate_coach_feedback(transcript)
-    return jsonify(feedback)
+    if serving_mock_data():
+        return raw_response(MOCK_COACHING_BYTES)
+    
+    feedback = await generate_coach_feedback(transcript)
+    return json_response(feedback)
+
+@app.route('/api/analyze', methods=['POST'])
+async def analyze():
+    """
+    Return summary, sentiment and coaching feedback from a single analysis
+    """
+    data = await read_json()
+    transcript = data.get('transcript', '')
+    
+    if not transcript:
+        return json_response({'error': 'No transcript provided'}, 400)
+    
+    if serving_mock_data():
+        return raw_response(MOCK_ANALYSIS_BYTES)
+    
+    analysis = await analyze_meeting(transcript)
+    return json_response(analysis)
+
+@app.route('/api/analyze-all', methods=['POST'])
+async def analyze_all():
+    """
+    Run summary, sentiment and coaching analysis concurrently
+    """
+    data = await read_json()
+    transcript = data.get('transcript', '')
+    
+    if not transcript:
+        return json_response({'error': 'No transcript provided'}, 400)
+    
+    if serving_mock_data():
+        return raw_response(MOCK_ANALYSIS_BYTES)
+    
+    summary, sentiment_analysis, feedback = await asyncio.gather(
+        generate_summary(transcript),
+        analyze_sentiment(transcript),
+        generate_coach_feedback(transcript)
+    )
+    return json_response({
+        'summary': summary['summary'],
+        'sentiment_analysis': sentiment_analysis['sentiment_analysis'],
+        'coaching_feedback': feedback['coaching_feedback'],
+        'status': 'success' if all(result['status'] == 'success' for result in (summary, sentiment_analysis, feedback)) else 'fallback'
+    })
+
+@app.route('/api/analyze-async', methods=['POST'])
+async def analyze_async():
+    """
+    Queue a meeting analysis on the OpenAI Batch API and return its job id
+    """
+    data = await read_json()
+    transcript = data.get('transcript', '')
+    
+    if not transcript:
+        return json_response({'error': 'No transcript provided'}, 400)
+    
+    try:
+        job_id = await submit_analysis_batch(transcript)
+    except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+        print(f"Batch submission failed: {str(e)}")
+        return json_response({'error': 'Could not submit analysis job'}, 502)
+    
+    return json_response({'job_id': job_id, 'status': 'submitted'}, 202)
+
+@app.route('/api/analyze-result/<job_id>', methods=['GET'])
+async def analyze_result(job_id):
+    """
+    Poll a queued analysis; returns the results once the batch has completed
+    """
+    if not re.fullmatch(r'[A-Za-z0-9_-]+', job_id):
+        return json_response({'error': 'Invalid job id'}, 400)
+    
+    try:
+        result = await get_analysis_batch_result(job_id)
+    except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+        print(f"Batch status check failed: {str(e)}")
+        return json_response({'error': 'Could not fetch analysis job'}, 502)
+    
+    return json_response(result)
 
 @app.route('/api/chat', methods=['POST'])
-def chat():
+async def chat():
     """
     Handle follow-up questions about the meeting
     """
-    data = request.json
+    data = await read_json()
     transcript = data.get('transcript', '')
     question = data.get('question', '')
     chat_history = data.get('chat_history', [])
     
     if not transcript or not question:
-        return jsonify({'error': 'Transcript or question missing'}), 400
+        return json_response({'error': 'Transcript or question missing'}, 400)
+    
+    if serving_mock_data():
+        return raw_response(MOCK_CHAT_BYTES[fallback_answer(question)])
+    
+    response = await handle_chat(transcript, question, chat_history)
+    return json_response(response)
+
+@app.route('/api/chat-stream', methods=['POST'])
+async def chat_stream():
+    """
+    Stream the answer to a follow-up question as server-sent events
+    """
+    data = await read_json()
+    transcript = data.get('transcript', '')
+    question = data.get('question', '')
+    chat_history = data.get('chat_history', [])
+    
+    if not transcript or not question:
+        return json_response({'error': 'Transcript or question missing'}, 400)
+    
+    if serving_mock_data():
+        return app.response_class(MOCK_CHAT_STREAM_BYTES[fallback_answer(question)], mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
+    
+    async def events():
+        async for event in stream_chat(transcript, question, chat_history):
+            yield b'data: ' + orjson.dumps(event) + b'\n\n'
+        yield b'data: [DONE]\n\n'
     
-    response = handle_chat(transcript, question, chat_history)
-    return jsonify(response)
+    return app.response_class(events(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=int(os.environ.get('PORT', 8000)))
@@ -0,0 +1,20 @@
+"""
+Production server settings, used as:
+
+    cd backend && hypercorn app:app --config file:hypercorn_config.py
+
+Each worker is a single asyncio process that keeps many OpenAI calls in
+flight at once, so a handful of workers is enough to use the CPUs.
+"""
+import os
+import multiprocessing
+
+bind = [f"0.0.0.0:{os.environ.get('PORT', 8000)}"]
+
+# Exported so each worker's OpenAI rate limiter can take its share of the account limits
+workers = int(os.environ.setdefault("WEB_CONCURRENCY", str(multiprocessing.cpu_count())))
+worker_class = "asyncio"
+
+# LLM calls can take tens of seconds; don't drop idle browser connections in between
+keep_alive_timeout = 75
+graceful_timeout = 30
@@ -0,0 +1,184 @@
+import os
+import re
+import asyncio
+import zlib
+import hashlib
+import functools
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Optional, Set, Tuple
+
+import orjson
+from diskcache import Cache
+
+CACHE_DIR = os.getenv("MEETING_CACHE_DIR", "/tmp/meeting_cache")
+
+# On disk so results survive dev-server reloads and are shared between workers
+result_cache = Cache(CACHE_DIR, size_limit=256 * 1024 * 1024, eviction_policy="least-recently-used")
+
+# Calls currently computing a result, so identical concurrent requests share one OpenAI call
+_in_flight: Dict[str, asyncio.Task] = {}
+
+# Longest a shared computation may run before it is abandoned and its key freed
+COMPUTE_TIMEOUT = float(os.getenv("MEETING_CACHE_COMPUTE_TIMEOUT", "600"))
+
+# Jaccard similarity above which a transcript is treated as a re-upload of a cached one
+SIMILARITY_THRESHOLD = float(os.getenv("MEETING_CACHE_SIMILARITY_THRESHOLD", "0.97"))
+
+_TIMESTAMP = re.compile(r"\[?\b\d{1,2}:\d{2}(?::\d{2})?(?:\s?[ap]m)?\b\]?", re.IGNORECASE)
+
+# Upper bound on shingles kept in memory per process (~80 bytes each, so ~80MB by default)
+MAX_INDEXED_SHINGLES = int(os.getenv("MEETING_CACHE_MAX_SHINGLES", "1000000"))
+
+# Shingle sets of recently cached transcripts keyed by transcript digest, with the
+# endpoints that cached a result for it; shared by all endpoints, least recent first
+_near_duplicates: "OrderedDict[str, Tuple[FrozenSet[int], Set[str]]]" = OrderedDict()
+_indexed_shingles = 0
+
+
+def _digest(part: Any) -> str:
+    if isinstance(part, str):
+        part = part.encode("utf-8")
+    else:
+        part = orjson.dumps(part, option=orjson.OPT_SORT_KEYS)
+    return hashlib.sha256(part).hexdigest()
+
+
+def cache_key(endpoint: str, *parts: Any) -> str:
+    """
+    Build a cache key from an endpoint name and the content it was computed from
+
+    Args:
+        endpoint: Name of the analysis (e.g. "summary", "chat")
+        parts: Transcript, question, chat history... in call order
+
+    Returns:
+        Key made of the endpoint and a SHA-256 digest per part
+    """
+    return ":".join([endpoint] + [_digest(part) for part in parts])
+
+
+def shingles(transcript: str) -> FrozenSet[int]:
+    """
+    Fingerprint a transcript as the set of its word 3-grams
+
+    Timestamps, case and whitespace are normalized away first, so
+    re-uploads that only differ in those compare as identical.
+
+    Args:
+        transcript: The meeting transcript text
+
+    Returns:
+        Set of CRC32 hashes, one per distinct 3-word window
+    """
+    words = _TIMESTAMP.sub(" ", transcript.lower()).split()
+    grams = (" ".join(words[i:i + 3]) for i in range(max(1, len(words) - 2)))
+    return frozenset(zlib.crc32(gram.encode("utf-8")) for gram in grams)
+
+
+def find_near_duplicate(endpoint: str, transcript_shingles: FrozenSet[int]) -> Optional[Dict[str, Any]]:
+    """
+    Look up the cached result of the most similar recently seen transcript
+
+    Args:
+        endpoint: Name of the analysis
+        transcript_shingles: Fingerprint of the transcript, from shingles()
+
+    Returns:
+        The cached result if a transcript reaches SIMILARITY_THRESHOLD, else None
+    """
+    best_digest, best_score = None, SIMILARITY_THRESHOLD
+    for digest, (cached_shingles, endpoints) in _near_duplicates.items():
+        if endpoint not in endpoints:
+            continue
+        smaller, larger = sorted((len(transcript_shingles), len(cached_shingles)))
+        # Jaccard can never exceed the size ratio, so skip the set operations
+        if smaller < best_score * larger:
+            continue
+        score = len(transcript_shingles & cached_shingles) / len(transcript_shingles | cached_shingles)
+        if score >= best_score:
+            best_digest, best_score = digest, score
+
+    if best_digest is None:
+        return None
+    return result_cache.get(f"{endpoint}:{best_digest}")
+
+
+def _index_transcript(
+    endpoint: str,
+    transcript: str,
+    transcript_shingles: Optional[FrozenSet[int]] = None
+) -> None:
+    global _indexed_shingles
+    digest = _digest(transcript)
+    entry = _near_duplicates.get(digest)
+    if entry is not None:
+        _near_duplicates.move_to_end(digest)
+    else:
+        # Only fingerprinted once per transcript, however many endpoints cache it
+        if transcript_shingles is None:
+            transcript_shingles = shingles(transcript)
+        entry = _near_duplicates[digest] = (transcript_shingles, set())
+        _indexed_shingles += len(transcript_shingles)
+        while _indexed_shingles > MAX_INDEXED_SHINGLES and len(_near_duplicates) > 1:
+            _, (evicted, _) = _near_duplicates.popitem(last=False)
+            _indexed_shingles -= len(evicted)
+    entry[1].add(endpoint)
+
+
+def get_result(endpoint: str, *parts: Any) -> Optional[Dict[str, Any]]:
+    return result_cache.get(cache_key(endpoint, *parts))
+
+
+def store_result(endpoint: str, result: Dict[str, Any], *parts: Any) -> None:
+    key = cache_key(endpoint, *parts)
+    result_cache.set(key, result)
+    if len(parts) == 1:
+        _index_transcript(endpoint, parts[0])
+
+
+def cached(endpoint: str) -> Callable[[Callable[..., Awaitable[Dict[str, Any]]]], Callable[..., Awaitable[Dict[str, Any]]]]:
+    """
+    Cache an async analysis helper's result keyed on the content of its arguments
+
+    Only results with status "success" are stored, so mock fallbacks served
+    while the OpenAI API is failing are retried on the next request. Helpers
+    keyed on the transcript alone also match near-duplicate transcripts.
+    Concurrent calls with the same key wait on the first one instead of
+    making their own request; that call is cancelled after COMPUTE_TIMEOUT
+    seconds, raising asyncio.TimeoutError to everyone waiting on it.
+
+    Args:
+        endpoint: Name of the analysis, used to namespace the cache key
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args):
+            key = cache_key(endpoint, *args)
+            result = result_cache.get(key)
+            if result is not None:
+                return result
+
+            transcript_shingles = shingles(args[0]) if len(args) == 1 else None
+            if transcript_shingles is not None:
+                result = find_near_duplicate(endpoint, transcript_shingles)
+                if result is not None:
+                    result_cache.set(key, result)
+                    return result
+
+            task = _in_flight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(compute(key, transcript_shingles, args))
+                _in_flight[key] = task
+                task.add_done_callback(lambda _: _in_flight.pop(key, None))
+            # Shielded so one caller disconnecting doesn't cancel the call for the others
+            return await asyncio.shield(task)
+
+        async def compute(key, transcript_shingles, args):
+            result = await asyncio.wait_for(func(*args), COMPUTE_TIMEOUT)
+            if result.get("status") == "success":
+                result_cache.set(key, result)
+                if transcript_shingles is not None:
+                    _index_transcript(endpoint, args[0], transcript_shingles)
+            return result
+        return wrapper
+    return decorator
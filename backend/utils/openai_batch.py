@@ -0,0 +1,154 @@
+import hashlib
+from typing import Any, Dict, Optional
+
+import httpx
+import orjson
+
+from utils import summarizer
+
+OPENAI_FILES_URL = "https://api.openai.com/v1/files"
+OPENAI_BATCHES_URL = "https://api.openai.com/v1/batches"
+
+# Batch request name -> (response field, payload builder)
+BATCH_ANALYSES = {
+    "summary": ("summary", summarizer.build_summary_payload),
+    "sentiment": ("sentiment_analysis", summarizer.build_sentiment_payload),
+    "coaching": ("coaching_feedback", summarizer.build_coaching_payload)
+}
+
+MOCK_JOB_PREFIX = "mock-"
+
+
+def _auth_headers() -> Dict[str, str]:
+    return {"Authorization": f"Bearer {summarizer.api_key}"}
+
+
+def meeting_id(transcript: str) -> str:
+    return hashlib.sha256(transcript.encode("utf-8")).hexdigest()[:12]
+
+
+async def _log_batch_errors(error_file_id: Optional[str]) -> None:
+    # Best effort: failing to read the error file must not hide the results we have
+    if not error_file_id:
+        return
+
+    try:
+        errors = await summarizer.http_client.get(f"{OPENAI_FILES_URL}/{error_file_id}/content", headers=_auth_headers())
+        errors.raise_for_status()
+        for line in errors.content.splitlines():
+            if line.strip():
+                result = orjson.loads(line)
+                print(f"Batch request {result.get('custom_id')} failed: {result.get('error') or (result.get('response') or {}).get('body')}")
+    except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+        print(f"Could not read batch error file {error_file_id}: {str(e)}")
+
+
+async def submit_analysis_batch(transcript: str) -> str:
+    """
+    Queue summary, sentiment and coaching requests for a transcript on the
+    OpenAI Batch API (half the token price, results within 24h)
+
+    Args:
+        transcript: The meeting transcript text
+
+    Returns:
+        The batch job id to poll with get_analysis_batch_result
+    """
+    if summarizer.use_mock_data:
+        return MOCK_JOB_PREFIX + meeting_id(transcript)
+
+    prefix = meeting_id(transcript)
+    batch_input = b"\n".join(
+        orjson.dumps({
+            "custom_id": f"{prefix}:{name}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": build_payload(transcript)
+        })
+        for name, (_, build_payload) in BATCH_ANALYSES.items()
+    )
+
+    upload = await summarizer.http_client.post(
+        OPENAI_FILES_URL,
+        headers=_auth_headers(),
+        data={"purpose": "batch"},
+        files={"file": (f"{prefix}.jsonl", batch_input, "application/jsonl")}
+    )
+    upload.raise_for_status()
+
+    batch = await summarizer.http_client.post(
+        OPENAI_BATCHES_URL,
+        headers={**_auth_headers(), "Content-Type": "application/json"},
+        content=orjson.dumps({
+            "input_file_id": orjson.loads(upload.content)["id"],
+            "endpoint": "/v1/chat/completions",
+            "completion_window": "24h"
+        })
+    )
+    batch.raise_for_status()
+    return orjson.loads(batch.content)["id"]
+
+
+async def get_analysis_batch_result(batch_id: str) -> Dict[str, Any]:
+    """
+    Check a batch job and collect its analyses once it has completed
+
+    Args:
+        batch_id: Id returned by submit_analysis_batch
+
+    Returns:
+        {"status": <batch status>} while the job is pending or if it failed
+        ("failed" when it completed without any successful request),
+        otherwise the summary, sentiment analysis and coaching feedback
+        with status "success" ("incomplete" if some requests failed)
+    """
+    if summarizer.use_mock_data and batch_id.startswith(MOCK_JOB_PREFIX):
+        return {
+            "summary": summarizer.mock_summary,
+            "sentiment_analysis": summarizer.mock_sentiment,
+            "coaching_feedback": summarizer.mock_coaching,
+            "status": "success"
+        }
+
+    response = await summarizer.http_client.get(f"{OPENAI_BATCHES_URL}/{batch_id}", headers=_auth_headers())
+    response.raise_for_status()
+    batch = orjson.loads(response.content)
+
+    if batch["status"] != "completed":
+        return {"status": batch["status"]}
+
+    if not batch.get("output_file_id"):
+        # Every request failed: OpenAI completes the batch with only an error file
+        await _log_batch_errors(batch.get("error_file_id"))
+        return {"status": "failed"}
+
+    output = await summarizer.http_client.get(f"{OPENAI_FILES_URL}/{batch['output_file_id']}/content", headers=_auth_headers())
+    output.raise_for_status()
+
+    analysis: Dict[str, Any] = {"status": "success"}
+    for line in output.content.splitlines():
+        if not line.strip():
+            continue
+
+        result = orjson.loads(line)
+        name = result["custom_id"].rsplit(":", 1)[-1]
+        if name not in BATCH_ANALYSES:
+            print(f"Skipping unexpected batch request {result['custom_id']}")
+            continue
+        field = BATCH_ANALYSES[name][0]
+
+        body = (result.get("response") or {}).get("body") or {}
+        if not body.get("choices"):
+            print(f"Batch request {result['custom_id']} failed: {result.get('error')}")
+            continue
+
+        content = body["choices"][0]["message"]["content"]
+        try:
+            analysis[field] = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            analysis[field] = content
+
+    if len(analysis) <= len(BATCH_ANALYSES):
+        analysis["status"] = "incomplete"
+        await _log_batch_errors(batch.get("error_file_id"))
+    return analysis
@@ -0,0 +1,231 @@
+import gzip
+import asyncio
+import random
+import time
+from typing import Any, AsyncIterator, Dict, Optional, Set, Tuple
+
+import httpx
+import orjson
+
+OPENAI_CHAT_COMPLETIONS_URL = "https://api.openai.com/v1/chat/completions"
+
+
+class TokenBucket:
+    """
+    Per-minute budget that refills continuously, used for both the
+    requests-per-minute and tokens-per-minute limits
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.available = per_minute
+        self.last_refill = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.available = min(self.capacity, self.available + (now - self.last_refill) * self.capacity / 60)
+        self.last_refill = now
+
+    def seconds_until_available(self, amount: float) -> float:
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.available >= amount:
+            return 0.0
+        return (amount - self.available) * 60 / self.capacity
+
+    def consume(self, amount: float) -> None:
+        self.available -= min(amount, self.capacity)
+
+
+def estimate_tokens(payload: Dict[str, Any]) -> int:
+    """
+    Rough token cost of a chat completion request (prompt + completion budget)
+
+    Args:
+        payload: The chat completion request body
+
+    Returns:
+        Estimated number of tokens, using ~4 characters per token for the prompt
+    """
+    prompt_chars = sum(len(message.get("content", "")) for message in payload.get("messages", []))
+    return prompt_chars // 4 + payload.get("max_tokens", 0)
+
+
+class OpenAIRequestPool:
+    """
+    Dispatches OpenAI requests concurrently while staying under the
+    account's request and token rate limits, retrying 429/5xx responses
+    and transport errors with exponential backoff
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        api_key: str,
+        url: str = OPENAI_CHAT_COMPLETIONS_URL,
+        max_requests_per_minute: float = 500,
+        max_tokens_per_minute: float = 40000,
+        max_attempts: int = 5,
+        gzip_min_bytes: Optional[int] = None,
+        deadline: float = 300,
+    ):
+        self.client = client
+        self.url = url
+        self.max_attempts = max_attempts
+        self.deadline = deadline
+        self.gzip_min_bytes = gzip_min_bytes
+        self.headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {api_key}"
+        }
+        self._requests = TokenBucket(max_requests_per_minute)
+        self._tokens = TokenBucket(max_tokens_per_minute)
+        self._rate_limit_lock = asyncio.Lock()
+        self._queue: Optional[asyncio.Queue] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._in_flight: Set[asyncio.Task] = set()
+
+    async def submit(self, payload: Dict[str, Any]) -> httpx.Response:
+        """
+        Queue a chat completion request and wait for its response
+
+        Args:
+            payload: The chat completion request body
+
+        Returns:
+            The final HTTP response; 429/5xx are only returned once
+            max_attempts is exhausted
+
+        Raises:
+            asyncio.TimeoutError: No response within the pool's deadline,
+                including time spent waiting for rate limit capacity
+        """
+        # Done in the caller's task so a malformed payload raises here, not in the dispatcher
+        request = (estimate_tokens(payload), *self._encode(payload))
+
+        if self._dispatcher is None or self._dispatcher.done():
+            queue = asyncio.Queue()
+            # Carry over requests queued for a dispatcher that has stopped
+            while self._queue is not None and not self._queue.empty():
+                queue.put_nowait(self._queue.get_nowait())
+            self._queue = queue
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((request, future, 1))
+        return await asyncio.wait_for(future, self.deadline)
+
+    async def _dispatch(self) -> None:
+        while True:
+            request, future, attempt = await self._queue.get()
+            if future.done():
+                continue
+
+            try:
+                await self._acquire(request[0])
+                task = asyncio.create_task(self._send(request, future, attempt))
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                continue
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def stream(self, payload: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Send a streaming chat completion request and yield its content as it arrives
+
+        429/5xx responses and transport errors are retried like submit() as
+        long as nothing has been streamed yet; later failures are raised.
+
+        Args:
+            payload: The chat completion request body
+
+        Yields:
+            Content deltas of the completion, in order
+        """
+        payload = dict(payload, stream=True)
+        tokens = estimate_tokens(payload)
+        body, headers = self._encode(payload)
+        for attempt in range(1, self.max_attempts + 1):
+            await self._acquire(tokens)
+            streamed = False
+            try:
+                async with self.client.stream("POST", self.url, headers=headers, content=body) as response:
+                    if response.status_code == 200:
+                        async for line in response.aiter_lines():
+                            if not line.startswith("data: ") or line == "data: [DONE]":
+                                continue
+                            choices = orjson.loads(line[len("data: "):]).get("choices")
+                            content = choices[0].get("delta", {}).get("content") if choices else None
+                            if content:
+                                streamed = True
+                                yield content
+                        return
+
+                    if (response.status_code != 429 and response.status_code < 500) or attempt >= self.max_attempts:
+                        await response.aread()
+                        response.raise_for_status()
+                    delay = self._retry_after(response) or self._backoff(attempt)
+                    failure = f"got status {response.status_code}"
+            except httpx.TransportError as e:
+                if streamed or attempt >= self.max_attempts:
+                    raise
+                delay = self._backoff(attempt)
+                failure = f"failed ({e!r})"
+            print(f"OpenAI stream attempt {attempt} {failure}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    async def _acquire(self, tokens: int) -> None:
+        async with self._rate_limit_lock:
+            while True:
+                wait = max(self._requests.seconds_until_available(1), self._tokens.seconds_until_available(tokens))
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            self._requests.consume(1)
+            self._tokens.consume(tokens)
+
+    async def _send(self, request: Tuple[int, bytes, Dict[str, str]], future: asyncio.Future, attempt: int) -> None:
+        _, body, headers = request
+        try:
+            response = await self.client.post(self.url, headers=headers, content=body)
+        except httpx.HTTPError as e:
+            if attempt >= self.max_attempts:
+                if not future.done():
+                    future.set_exception(e)
+                return
+            delay = self._backoff(attempt)
+            print(f"OpenAI request attempt {attempt} failed ({e!r}), retrying in {delay:.1f}s")
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+        else:
+            if (response.status_code != 429 and response.status_code < 500) or attempt >= self.max_attempts:
+                if not future.done():
+                    future.set_result(response)
+                return
+            delay = self._retry_after(response) or self._backoff(attempt)
+            print(f"OpenAI request attempt {attempt} got status {response.status_code}, retrying in {delay:.1f}s")
+
+        await asyncio.sleep(delay)
+        self._queue.put_nowait((request, future, attempt + 1))
+
+    def _encode(self, payload: Dict[str, Any]) -> Tuple[bytes, Dict[str, str]]:
+        body = orjson.dumps(payload)
+        if self.gzip_min_bytes is None or len(body) < self.gzip_min_bytes:
+            return body, self.headers
+        # Level 1: transcripts compress well even at the fastest setting
+        return gzip.compress(body, compresslevel=1), {**self.headers, "Content-Encoding": "gzip"}
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        return min(60.0, 2 ** (attempt - 1)) * random.uniform(0.5, 1.0)
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> Optional[float]:
+        try:
+            return float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            return None
@@ -1,51 +1,146 @@
 import os
-import json
-import requests
-from typing import Dict, List, Any
+import re
+import asyncio
+import functools
+import httpx
+import orjson
+from typing import AsyncIterator, Dict, List, Any
+from utils.cache import cached, get_result, store_result
+from utils.openai_pool import OpenAIRequestPool
 
 api_key = os.getenv("OPENAI_API_KEY", "sk-demo-key123456789")
 use_mock_data = True
 
-def generate_summary(transcript: str) -> Dict[str, Any]:
+# Shared across requests so OpenAI calls reuse pooled HTTP/2 connections. httpx
+# drops idle connections after 5s by default, which would mean a fresh TLS
+# handshake for nearly every user action, so keep them open for a minute.
+http_client = httpx.AsyncClient(
+    http2=True,
+    timeout=60,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32, keepalive_expiry=60)
+)
+# Rate limits are per account, so each server worker gets an equal share
+server_workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+openai_pool = OpenAIRequestPool(
+    http_client,
+    api_key,
+    max_requests_per_minute=int(os.getenv("OPENAI_MAX_REQUESTS_PER_MINUTE", "500")) / server_workers,
+    max_tokens_per_minute=int(os.getenv("OPENAI_MAX_TOKENS_PER_MINUTE", "40000")) / server_workers,
+    # Opt-in: gzip request bodies at least this large (useful for long transcripts on slow uplinks)
+    gzip_min_bytes=int(os.environ["OPENAI_GZIP_MIN_BYTES"]) if os.getenv("OPENAI_GZIP_MIN_BYTES") else None
+)
+
+def serving_mock_data() -> bool:
+    # The only demo-mode check: routes serve the constant mock responses before
+    # any helper runs, so helpers and the cache only ever see real requests
+    return use_mock_data
+
+# Keyword -> mock answer category; when several match, the earlier category wins
+question_categories = {
+    "payment": "payment",
+    "integration": "payment",
+    "market": "market",
+    "research": "market",
+    "concern": "concern",
+    "worry": "concern",
+    "issue": "concern",
+    "action": "action",
+    "task": "action",
+    "assign": "action",
+    "decision": "decision",
+    "decide": "decision"
+}
+_category_rank = {category: rank for rank, category in enumerate(dict.fromkeys(question_categories.values()))}
+# Lookahead so overlapping keywords are all reported in a single scan
+_question_keywords = re.compile("(?=(" + "|".join(map(re.escape, question_categories)) + "))")
+
+# Memoized: batch evaluations replay the same question sets
+@functools.lru_cache(maxsize=1024)
+def classify_question(question: str) -> str:
     """
-    Generate a structured summary of a meeting transcript
+    Map a question to a mock answer category with one pass over the text
     
     Args:
-        transcript: The meeting transcript text
+        question: The user's question
         
     Returns:
-        Dictionary containing key points, action items, and decisions
+        The highest-priority matching category, or "default"
     """
-    mock_summary = {
-        "key_points": [
-            {"point": "Q1 results discussion"},
-            {"point": "European market expansion plans"},
-            {"point": "Technical readiness for European deployment"},
-            {"point": "Payment integration delays"},
-            {"point": "Market research findings for Germany and France"}
-        ],
-        "action_items": [
-            {"task": "Complete payment integration", "assignee": "David"},
-            {"task": "Organize product workshops", "assignee": "Jennifer"},
-            {"task": "Finalize marketing strategy", "assignee": "Jennifer"},
-            {"task": "Prioritize lead list", "assignee": "Robert"},
-            {"task": "Prepare customized pitches", "assignee": "Robert"},
-            {"task": "Conduct security audits", "assignee": "Michael"}
-        ],
-        "decisions": [
-            {"decision": "Push launch by two weeks to address payment integration issues"},
-            {"decision": "Jennifer to work with David on product adaptation for European users"},
-            {"decision": "Reconvene next week to check progress"}
-        ]
+    category, best_rank = "default", len(_category_rank)
+    for match in _question_keywords.finditer(question.lower()):
+        rank = _category_rank[question_categories[match.group(1)]]
+        if rank < best_rank:
+            category, best_rank = question_categories[match.group(1)], rank
+            if rank == 0:
+                break
+    return category
+
+mock_summary = {
+    "key_points": [
+        {"point": "Q1 results discussion"},
+        {"point": "European market expansion plans"},
+        {"point": "Technical readiness for European deployment"},
+        {"point": "Payment integration delays"},
+        {"point": "Market research findings for Germany and France"}
+    ],
+    "action_items": [
+        {"task": "Complete payment integration", "assignee": "David"},
+        {"task": "Organize product workshops", "assignee": "Jennifer"},
+        {"task": "Finalize marketing strategy", "assignee": "Jennifer"},
+        {"task": "Prioritize lead list", "assignee": "Robert"},
+        {"task": "Prepare customized pitches", "assignee": "Robert"},
+        {"task": "Conduct security audits", "assignee": "Michael"}
+    ],
+    "decisions": [
+        {"decision": "Push launch by two weeks to address payment integration issues"},
+        {"decision": "Jennifer to work with David on product adaptation for European users"},
+        {"decision": "Reconvene next week to check progress"}
+    ]
+}
+
+mock_sentiment = {
+    "overall_sentiment": "positive",
+    "sentiment_score": 0.75,
+    "sentiment_trends": [
+        {"segment": "Beginning", "tone": "Professional and focused", "score": 0.7},
+        {"segment": "Middle", "tone": "Slightly tense during product concerns", "score": 0.6},
+        {"segment": "End", "tone": "Collaborative and optimistic", "score": 0.9}
+    ],
+    "tension_points": [
+        {"topic": "Product readiness", "description": "David expressed concerns about payment integration and product alignment with European expectations"}
+    ],
+    "morale_indicators": [
+        {"indicator": "Team members readily volunteering for tasks", "type": "positive"},
+        {"indicator": "Collaborative problem-solving approach", "type": "positive"},
+        {"indicator": "Concerns addressed constructively", "type": "positive"}
+    ]
+}
+
+mock_coaching = {
+    "effectiveness_score": 8,
+    "strengths": [
+        {"strength": "Clear agenda and structure"},
+        {"strength": "Active participation from all team members"},
+        {"strength": "Constructive handling of concerns"},
+        {"strength": "Specific action items assigned with clear ownership"}
+    ],
+    "improvement_areas": [
+        {"area": "More thorough market research before planning expansion"},
+        {"area": "Earlier identification of technical dependencies"}
+    ],
+    "recommendations": [
+        {"recommendation": "Schedule shorter follow-up meetings to track progress on action items"},
+        {"recommendation": "Create a shared document for European market requirements"},
+        {"recommendation": "Involve technical team earlier in product planning"}
+    ],
+    "participation_balance": {
+        "balanced": True,
+        "description": "All team members contributed meaningfully to the discussion",
+        "dominant_speakers": ["Sarah", "David"]
     }
-    
-    if use_mock_data:
-        return {
-            "summary": mock_summary,
-            "status": "success"
-        }
-    
-    prompt = f"""
+}
+
+_SUMMARY_PROMPT_PREFIX = """
     You are an AI assistant specialized in summarizing meeting transcripts.
     Please analyze the following meeting transcript and provide:
     1. Key Discussion Points: Extract the main topics discussed
@@ -53,58 +148,201 @@ def generate_summary(transcript: str) -> Dict[str, Any]:
     3. Decisions Made: Identify decisions that were finalized during the meeting
     
     Meeting Transcript:
-    {transcript}
+    """
+_SUMMARY_PROMPT_SUFFIX = """
     
     Format your response as JSON with the following structure:
-    {{
+    {
         "key_points": [
-            {{"point": "Description of key point 1"}},
-            {{"point": "Description of key point 2"}}
+            {"point": "Description of key point 1"},
+            {"point": "Description of key point 2"}
         ],
         "action_items": [
-            {{"task": "Task description", "assignee": "Person name"}},
-            {{"task": "Task description", "assignee": "Person name"}}
+            {"task": "Task description", "assignee": "Person name"},
+            {"task": "Task description", "assignee": "Person name"}
         ],
         "decisions": [
-            {{"decision": "Description of decision 1"}},
-            {{"decision": "Description of decision 2"}}
+            {"decision": "Description of decision 1"},
+            {"decision": "Description of decision 2"}
         ]
-    }}
+    }
+    """
+
+def build_summary_payload(transcript: str) -> Dict[str, Any]:
+    return {
+        "model": "gpt-4",
+        "messages": [
+            {"role": "system", "content": "You are a meeting summarization assistant."},
+            {"role": "user", "content": _SUMMARY_PROMPT_PREFIX + transcript + _SUMMARY_PROMPT_SUFFIX}
+        ],
+        "temperature": 0.3,
+        "max_tokens": 1000
+    }
+
+# Transcripts longer than this (~2K tokens) are summarized in parallel chunks that are then merged
+SUMMARY_CHUNK_CHARS = 8000
+# Partial summaries merged by one request (~4K tokens, leaving room for the prompt and
+# 1000 output tokens in gpt-4's 8K context); more than that are merged in tiers
+SUMMARY_MERGE_CHARS = 16000
+
+# Start of a speaker turn, e.g. "Sarah:" or "[00:12:03] David Chen:"
+_SPEAKER_TURN = re.compile(r"^\s*(?:\[[^\]]*\]\s*)?[A-Z][\w .'-]{0,40}:")
+
+_SUMMARY_MERGE_PROMPT_PREFIX = """
+    You are an AI assistant specialized in summarizing meeting transcripts.
+    The following are summaries of consecutive parts of one meeting, in order.
+    Merge them into a single summary of the whole meeting: combine duplicate key points,
+    keep every action item with its assignee, and drop decisions that were reversed later.
+    
+    Partial Summaries:
+    """
+
+def _split_long_turn(turn: str, max_chars: int) -> List[str]:
+    pieces = []
+    while len(turn) > max_chars:
+        window = turn[:max_chars]
+        # Prefer the last sentence end in the second half of the window, then the last space
+        cut = max(window.rfind(". "), window.rfind("? "), window.rfind("! "), window.rfind("\n")) + 1
+        if cut < max_chars // 2:
+            cut = window.rfind(" ") + 1
+        if cut <= 0:
+            cut = max_chars
+        pieces.append(turn[:cut])
+        turn = turn[cut:]
+    pieces.append(turn)
+    return pieces
+
+def split_transcript(transcript: str, max_chars: int = SUMMARY_CHUNK_CHARS) -> List[str]:
     """
+    Split a transcript into chunks of at most max_chars, breaking between speaker turns
     
-    try:
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_key}"
-        }
+    Turns longer than max_chars (or transcripts pasted as a single line) are
+    split at sentence ends, or failing that at whitespace.
+    
+    Args:
+        transcript: The meeting transcript text
+        max_chars: Maximum chunk size
         
-        payload = {
-            "model": "gpt-4",
-            "messages": [
-                {"role": "system", "content": "You are a meeting summarization assistant."},
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": 0.3,
-            "max_tokens": 1000
-        }
+    Returns:
+        List of transcript chunks, in order
+    """
+    turns = []
+    for line in transcript.splitlines(keepends=True):
+        if turns and not _SPEAKER_TURN.match(line):
+            turns[-1] += line
+        else:
+            turns.append(line)
+    
+    chunks, current = [], ""
+    for turn in (piece for turn in turns for piece in _split_long_turn(turn, max_chars)):
+        if current and len(current) + len(turn) > max_chars:
+            chunks.append(current)
+            current = ""
+        current += turn
+    if current:
+        chunks.append(current)
+    return chunks
+
+def build_summary_merge_payload(partial_summaries: List[str]) -> Dict[str, Any]:
+    parts = "\n\n".join(f"Part {part}:\n{summary}" for part, summary in enumerate(partial_summaries, start=1))
+    return {
+        "model": "gpt-4",
+        "messages": [
+            {"role": "system", "content": "You are a meeting summarization assistant."},
+            {"role": "user", "content": _SUMMARY_MERGE_PROMPT_PREFIX + parts + _SUMMARY_PROMPT_SUFFIX}
+        ],
+        "temperature": 0.3,
+        "max_tokens": 1000
+    }
+
+def group_partial_summaries(partial_summaries: List[str], max_chars: int = SUMMARY_MERGE_CHARS) -> List[List[str]]:
+    """
+    Pack consecutive partial summaries into groups of about max_chars
+    
+    Args:
+        partial_summaries: Summaries of consecutive parts of a meeting, in order
+        max_chars: Maximum combined size of a group
+        
+    Returns:
+        Groups of partial summaries, in order; every group but a lone last
+        one holds at least two, so each merge tier shrinks the list
+    """
+    groups, size = [], 0
+    for summary in partial_summaries:
+        if groups and (len(groups[-1]) < 2 or size + len(summary) <= max_chars):
+            groups[-1].append(summary)
+            size += len(summary)
+        else:
+            groups.append([summary])
+            size = len(summary)
+    return groups
+
+async def _completion_text(payload: Dict[str, Any]) -> str:
+    response = await openai_pool.submit(payload)
+    response.raise_for_status()
+    return orjson.loads(response.content)["choices"][0]["message"]["content"]
+
+async def _merge_summaries(partial_summaries: List[str]) -> str:
+    if len(partial_summaries) == 1:
+        return partial_summaries[0]
+    return await _completion_text(build_summary_merge_payload(partial_summaries))
+
+async def build_merged_summary_payload(chunks: List[str]) -> Dict[str, Any]:
+    """
+    Summarize each chunk of a long transcript concurrently and build the
+    request that merges the partial summaries into one
+    
+    When the partial summaries don't fit in one merge prompt, groups of them
+    are merged concurrently first, repeating until they do.
+    
+    Args:
+        chunks: The transcript split with split_transcript
         
-        response = requests.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers=headers,
-            json=payload
-        )
+    Returns:
+        Chat completion request body for the final merge step
+    """
+    partial_summaries = await asyncio.gather(*[
+        _completion_text(build_summary_payload(chunk)) for chunk in chunks
+    ])
+    
+    groups = group_partial_summaries(partial_summaries)
+    while len(groups) > 1:
+        partial_summaries = await asyncio.gather(*[_merge_summaries(group) for group in groups])
+        groups = group_partial_summaries(partial_summaries)
+    
+    return build_summary_merge_payload(groups[0])
+
+@cached(endpoint="summary")
+async def generate_summary(transcript: str) -> Dict[str, Any]:
+    """
+    Generate a structured summary of a meeting transcript
+    
+    Args:
+        transcript: The meeting transcript text
+        
+    Returns:
+        Dictionary containing key points, action items, and decisions
+    """
+    try:
+        chunks = split_transcript(transcript) if len(transcript) > SUMMARY_CHUNK_CHARS else [transcript]
+        if len(chunks) > 1:
+            payload = await build_merged_summary_payload(chunks)
+        else:
+            payload = build_summary_payload(transcript)
+        
+        response = await openai_pool.submit(payload)
         
         if response.status_code == 200:
-            response_json = response.json()
+            response_json = orjson.loads(response.content)
             summary_text = response_json["choices"][0]["message"]["content"]
             
             try:
-                summary_json = json.loads(summary_text)
+                summary_json = orjson.loads(summary_text)
                 return {
                     "summary": summary_json,
                     "status": "success"
                 }
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 return {
                     "summary": summary_text,
                     "status": "success"
@@ -113,50 +351,16 @@ def generate_summary(transcript: str) -> Dict[str, Any]:
             print(f"API request failed with status code {response.status_code}: {response.text}")
             return {
                 "summary": mock_summary,
-                "status": "success"
+                "status": "fallback"
             }
     except Exception as e:
         print(f"Exception occurred: {str(e)}")
         return {
             "summary": mock_summary,
-            "status": "success"
+            "status": "fallback"
         }
 
-def analyze_sentiment(transcript: str) -> Dict[str, Any]:
-    """
-    Analyze the sentiment and emotional tone of a meeting transcript
-    
-    Args:
-        transcript: The meeting transcript text
-        
-    Returns:
-        Dictionary containing sentiment analysis results
-    """
-    mock_sentiment = {
-        "overall_sentiment": "positive",
-        "sentiment_score": 0.75,
-        "sentiment_trends": [
-            {"segment": "Beginning", "tone": "Professional and focused", "score": 0.7},
-            {"segment": "Middle", "tone": "Slightly tense during product concerns", "score": 0.6},
-            {"segment": "End", "tone": "Collaborative and optimistic", "score": 0.9}
-        ],
-        "tension_points": [
-            {"topic": "Product readiness", "description": "David expressed concerns about payment integration and product alignment with European expectations"}
-        ],
-        "morale_indicators": [
-            {"indicator": "Team members readily volunteering for tasks", "type": "positive"},
-            {"indicator": "Collaborative problem-solving approach", "type": "positive"},
-            {"indicator": "Concerns addressed constructively", "type": "positive"}
-        ]
-    }
-    
-    if use_mock_data:
-        return {
-            "sentiment_analysis": mock_sentiment,
-            "status": "success"
-        }
-    
-    prompt = f"""
+_SENTIMENT_PROMPT_PREFIX = """
     You are an AI assistant specialized in analyzing the emotional tone of meetings.
     Please analyze the following meeting transcript and provide:
     1. Overall Sentiment: The general emotional tone of the meeting (positive, negative, neutral)
@@ -165,59 +369,65 @@ def analyze_sentiment(transcript: str) -> Dict[str, Any]:
     4. Team Morale Indicators: Signs of team engagement, enthusiasm, or disengagement
     
     Meeting Transcript:
-    {transcript}
+    """
+_SENTIMENT_PROMPT_SUFFIX = """
     
     Format your response as JSON with the following structure:
-    {{
+    {
         "overall_sentiment": "positive/negative/neutral",
         "sentiment_score": 0.75, # 0 to 1 scale, higher is more positive
         "sentiment_trends": [
-            {{"segment": "Beginning", "tone": "Description", "score": 0.8}},
-            {{"segment": "Middle", "tone": "Description", "score": 0.6}},
-            {{"segment": "End", "tone": "Description", "score": 0.7}}
+            {"segment": "Beginning", "tone": "Description", "score": 0.8},
+            {"segment": "Middle", "tone": "Description", "score": 0.6},
+            {"segment": "End", "tone": "Description", "score": 0.7}
         ],
         "tension_points": [
-            {{"topic": "Topic where tension occurred", "description": "Description of the tension"}}
+            {"topic": "Topic where tension occurred", "description": "Description of the tension"}
         ],
         "morale_indicators": [
-            {{"indicator": "Description of morale indicator", "type": "positive/negative"}}
+            {"indicator": "Description of morale indicator", "type": "positive/negative"}
         ]
-    }}
+    }
     """
+
+def build_sentiment_payload(transcript: str) -> Dict[str, Any]:
+    return {
+        "model": "gpt-4",
+        "messages": [
+            {"role": "system", "content": "You are a meeting sentiment analysis assistant."},
+            {"role": "user", "content": _SENTIMENT_PROMPT_PREFIX + transcript + _SENTIMENT_PROMPT_SUFFIX}
+        ],
+        "temperature": 0.3,
+        "max_tokens": 1000
+    }
+
+@cached(endpoint="sentiment")
+async def analyze_sentiment(transcript: str) -> Dict[str, Any]:
+    """
+    Analyze the sentiment and emotional tone of a meeting transcript
     
-    try:
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_key}"
-        }
+    Args:
+        transcript: The meeting transcript text
         
-        payload = {
-            "model": "gpt-4",
-            "messages": [
-                {"role": "system", "content": "You are a meeting sentiment analysis assistant."},
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": 0.3,
-            "max_tokens": 1000
-        }
+    Returns:
+        Dictionary containing sentiment analysis results
+    """
+    try:
+        payload = build_sentiment_payload(transcript)
         
-        response = requests.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers=headers,
-            json=payload
-        )
+        response = await openai_pool.submit(payload)
         
         if response.status_code == 200:
-            response_json = response.json()
+            response_json = orjson.loads(response.content)
             sentiment_text = response_json["choices"][0]["message"]["content"]
             
             try:
-                sentiment_json = json.loads(sentiment_text)
+                sentiment_json = orjson.loads(sentiment_text)
                 return {
                     "sentiment_analysis": sentiment_json,
                     "status": "success"
                 }
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 return {
                     "sentiment_analysis": sentiment_text,
                     "status": "success"
@@ -226,56 +436,16 @@ def analyze_sentiment(transcript: str) -> Dict[str, Any]:
             print(f"API request failed with status code {response.status_code}: {response.text}")
             return {
                 "sentiment_analysis": mock_sentiment,
-                "status": "success"
+                "status": "fallback"
             }
     except Exception as e:
         print(f"Exception occurred: {str(e)}")
         return {
             "sentiment_analysis": mock_sentiment,
-            "status": "success"
+            "status": "fallback"
         }
 
-def generate_coach_feedback(transcript: str) -> Dict[str, Any]:
-    """
-    Generate coaching feedback on meeting effectiveness
-    
-    Args:
-        transcript: The meeting transcript text
-        
-    Returns:
-        Dictionary containing coaching feedback
-    """
-    mock_coaching = {
-        "effectiveness_score": 8,
-        "strengths": [
-            {"strength": "Clear agenda and structure"},
-            {"strength": "Active participation from all team members"},
-            {"strength": "Constructive handling of concerns"},
-            {"strength": "Specific action items assigned with clear ownership"}
-        ],
-        "improvement_areas": [
-            {"area": "More thorough market research before planning expansion"},
-            {"area": "Earlier identification of technical dependencies"}
-        ],
-        "recommendations": [
-            {"recommendation": "Schedule shorter follow-up meetings to track progress on action items"},
-            {"recommendation": "Create a shared document for European market requirements"},
-            {"recommendation": "Involve technical team earlier in product planning"}
-        ],
-        "participation_balance": {
-            "balanced": True,
-            "description": "All team members contributed meaningfully to the discussion",
-            "dominant_speakers": ["Sarah", "David"]
-        }
-    }
-    
-    if use_mock_data:
-        return {
-            "coaching_feedback": mock_coaching,
-            "status": "success"
-        }
-    
-    prompt = f"""
+_COACHING_PROMPT_PREFIX = """
     You are an AI meeting coach specialized in improving meeting effectiveness.
     Please analyze the following meeting transcript and provide:
     1. Meeting Effectiveness Score: Rate the meeting's effectiveness on a scale of 1-10
@@ -285,64 +455,70 @@ def generate_coach_feedback(transcript: str) -> Dict[str, Any]:
     5. Participation Balance: Analysis of speaking time distribution
     
     Meeting Transcript:
-    {transcript}
+    """
+_COACHING_PROMPT_SUFFIX = """
     
     Format your response as JSON with the following structure:
-    {{
+    {
         "effectiveness_score": 7,
         "strengths": [
-            {{"strength": "Description of what went well"}},
-            {{"strength": "Description of what went well"}}
+            {"strength": "Description of what went well"},
+            {"strength": "Description of what went well"}
         ],
         "improvement_areas": [
-            {{"area": "Description of improvement area"}},
-            {{"area": "Description of improvement area"}}
+            {"area": "Description of improvement area"},
+            {"area": "Description of improvement area"}
         ],
         "recommendations": [
-            {{"recommendation": "Actionable suggestion"}},
-            {{"recommendation": "Actionable suggestion"}}
+            {"recommendation": "Actionable suggestion"},
+            {"recommendation": "Actionable suggestion"}
         ],
-        "participation_balance": {{
+        "participation_balance": {
             "balanced": true/false,
             "description": "Description of speaking time distribution",
             "dominant_speakers": ["Name1", "Name2"]
-        }}
-    }}
+        }
+    }
+    """
+
+def build_coaching_payload(transcript: str) -> Dict[str, Any]:
+    return {
+        "model": "gpt-4",
+        "messages": [
+            {"role": "system", "content": "You are a meeting effectiveness coach."},
+            {"role": "user", "content": _COACHING_PROMPT_PREFIX + transcript + _COACHING_PROMPT_SUFFIX}
+        ],
+        "temperature": 0.3,
+        "max_tokens": 1000
+    }
+
+@cached(endpoint="coaching")
+async def generate_coach_feedback(transcript: str) -> Dict[str, Any]:
     """
+    Generate coaching feedback on meeting effectiveness
     
-    try:
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_key}"
-        }
+    Args:
+        transcript: The meeting transcript text
         
-        payload = {
-            "model": "gpt-4",
-            "messages": [
-                {"role": "system", "content": "You are a meeting effectiveness coach."},
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": 0.3,
-            "max_tokens": 1000
-        }
+    Returns:
+        Dictionary containing coaching feedback
+    """
+    try:
+        payload = build_coaching_payload(transcript)
         
-        response = requests.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers=headers,
-            json=payload
-        )
+        response = await openai_pool.submit(payload)
         
         if response.status_code == 200:
-            response_json = response.json()
+            response_json = orjson.loads(response.content)
             coaching_text = response_json["choices"][0]["message"]["content"]
             
             try:
-                coaching_json = json.loads(coaching_text)
+                coaching_json = orjson.loads(coaching_text)
                 return {
                     "coaching_feedback": coaching_json,
                     "status": "success"
                 }
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 return {
                     "coaching_feedback": coaching_text,
                     "status": "success"
@@ -351,61 +527,156 @@ def generate_coach_feedback(transcript: str) -> Dict[str, Any]:
             print(f"API request failed with status code {response.status_code}: {response.text}")
             return {
                 "coaching_feedback": mock_coaching,
-                "status": "success"
+                "status": "fallback"
             }
     except Exception as e:
         print(f"Exception occurred: {str(e)}")
         return {
             "coaching_feedback": mock_coaching,
-            "status": "success"
+            "status": "fallback"
         }
 
-def handle_chat(transcript: str, question: str, chat_history: List[Dict[str, str]]) -> Dict[str, Any]:
+_ANALYSIS_PROMPT_PREFIX = """
+    You are an AI assistant specialized in analyzing meeting transcripts.
+    Please analyze the following meeting transcript and provide:
+    1. Summary: Key discussion points, action items with assignees, and decisions made
+    2. Sentiment Analysis: Overall sentiment, how the tone changed, tension points and team morale indicators
+    3. Coaching Feedback: Effectiveness score (1-10), strengths, areas for improvement, recommendations and participation balance
+    
+    Meeting Transcript:
     """
-    Handle follow-up questions about the meeting
+_ANALYSIS_PROMPT_SUFFIX = """
+    
+    Format your response as JSON with the following structure:
+    {
+        "summary": {
+            "key_points": [{"point": "Description of key point"}],
+            "action_items": [{"task": "Task description", "assignee": "Person name"}],
+            "decisions": [{"decision": "Description of decision"}]
+        },
+        "sentiment_analysis": {
+            "overall_sentiment": "positive/negative/neutral",
+            "sentiment_score": 0.75, # 0 to 1 scale, higher is more positive
+            "sentiment_trends": [
+                {"segment": "Beginning", "tone": "Description", "score": 0.8},
+                {"segment": "Middle", "tone": "Description", "score": 0.6},
+                {"segment": "End", "tone": "Description", "score": 0.7}
+            ],
+            "tension_points": [{"topic": "Topic where tension occurred", "description": "Description of the tension"}],
+            "morale_indicators": [{"indicator": "Description of morale indicator", "type": "positive/negative"}]
+        },
+        "coaching_feedback": {
+            "effectiveness_score": 7,
+            "strengths": [{"strength": "Description of what went well"}],
+            "improvement_areas": [{"area": "Description of improvement area"}],
+            "recommendations": [{"recommendation": "Actionable suggestion"}],
+            "participation_balance": {
+                "balanced": true/false,
+                "description": "Description of speaking time distribution",
+                "dominant_speakers": ["Name1", "Name2"]
+            }
+        }
+    }
+    """
+
+def build_analysis_payload(transcript: str) -> Dict[str, Any]:
+    return {
+        "model": "gpt-4-turbo",
+        "messages": [
+            {"role": "system", "content": "You are a meeting analysis assistant."},
+            {"role": "user", "content": _ANALYSIS_PROMPT_PREFIX + transcript + _ANALYSIS_PROMPT_SUFFIX}
+        ],
+        "response_format": {"type": "json_object"},
+        "temperature": 0.3,
+        "max_tokens": 3000
+    }
+
+@cached(endpoint="analysis")
+async def analyze_meeting(transcript: str) -> Dict[str, Any]:
+    """
+    Summarize, analyze sentiment and coach a meeting in a single LLM call
     
     Args:
         transcript: The meeting transcript text
-        question: The user's question
-        chat_history: List of previous messages
         
     Returns:
-        Dictionary containing the AI's response
+        Dictionary containing the summary, sentiment analysis and coaching feedback
     """
-    mock_answers = {
-        "payment": "David is responsible for completing the payment integration within two weeks. He expressed concerns about the current readiness of this feature for the European market.",
-        "market": "The market research shows strong interest in the European market, particularly in Germany and France. Jennifer has prepared localized marketing materials and identified key influencers for each market.",
-        "concern": "David expressed concerns about the payment integration for European banks being behind schedule and about the product not being fully aligned with European user expectations based on limited market research.",
-        "action": "The action items assigned were: 1) David to complete payment integration within two weeks, 2) Jennifer to organize product workshops and finalize marketing strategy, 3) Robert to prioritize the lead list and prepare customized pitches, and 4) Michael to conduct additional security audits.",
-        "decision": "The team decided to push the launch by two weeks to address payment integration issues, have Jennifer work with David to ensure the product meets European user expectations, and reconvene next week to check progress.",
-        "default": "Based on the meeting transcript, the team discussed Q1 results and European market expansion plans. They identified issues with payment integration that will delay the launch by two weeks. Each team member was assigned specific action items to prepare for the European market launch."
+    fallback = {
+        "summary": mock_summary,
+        "sentiment_analysis": mock_sentiment,
+        "coaching_feedback": mock_coaching,
+        "status": "fallback"
     }
     
-    if use_mock_data:
-        answer = ""
-        question_lower = question.lower()
+    try:
+        payload = build_analysis_payload(transcript)
         
-        if "payment" in question_lower or "integration" in question_lower:
-            answer = mock_answers["payment"]
-        elif "market" in question_lower or "research" in question_lower:
-            answer = mock_answers["market"]
-        elif "concern" in question_lower or "worry" in question_lower or "issue" in question_lower:
-            answer = mock_answers["concern"]
-        elif "action" in question_lower or "task" in question_lower or "assign" in question_lower:
-            answer = mock_answers["action"]
-        elif "decision" in question_lower or "decide" in question_lower:
-            answer = mock_answers["decision"]
-        else:
-            answer = mock_answers["default"]
+        response = await openai_pool.submit(payload)
+        
+        if response.status_code == 200:
+            response_json = orjson.loads(response.content)
+            analysis_text = response_json["choices"][0]["message"]["content"]
             
-        return {
-            "answer": answer,
-            "status": "success"
-        }
+            try:
+                analysis_json = orjson.loads(analysis_text)
+            except orjson.JSONDecodeError:
+                print(f"Could not parse meeting analysis JSON: {analysis_text}")
+                return fallback
+            
+            sections = ("summary", "sentiment_analysis", "coaching_feedback")
+            if not isinstance(analysis_json, dict) or not all(isinstance(analysis_json.get(section), dict) for section in sections):
+                print(f"Meeting analysis is missing sections: {analysis_text}")
+                return fallback
+            
+            analysis = {section: analysis_json[section] for section in sections}
+            analysis["status"] = "success"
+            
+            # Seed the per-endpoint caches so the legacy routes are served from this analysis
+            store_result("summary", {"summary": analysis["summary"], "status": "success"}, transcript)
+            store_result("sentiment", {"sentiment_analysis": analysis["sentiment_analysis"], "status": "success"}, transcript)
+            store_result("coaching", {"coaching_feedback": analysis["coaching_feedback"], "status": "success"}, transcript)
+            return analysis
+        else:
+            print(f"API request failed with status code {response.status_code}: {response.text}")
+            return fallback
+    except Exception as e:
+        print(f"Exception occurred: {str(e)}")
+        return fallback
+
+mock_answers = {
+    "payment": "David is responsible for completing the payment integration within two weeks. He expressed concerns about the current readiness of this feature for the European market.",
+    "market": "The market research shows strong interest in the European market, particularly in Germany and France. Jennifer has prepared localized marketing materials and identified key influencers for each market.",
+    "concern": "David expressed concerns about the payment integration for European banks being behind schedule and about the product not being fully aligned with European user expectations based on limited market research.",
+    "action": "The action items assigned were: 1) David to complete payment integration within two weeks, 2) Jennifer to organize product workshops and finalize marketing strategy, 3) Robert to prioritize the lead list and prepare customized pitches, and 4) Michael to conduct additional security audits.",
+    "decision": "The team decided to push the launch by two weeks to address payment integration issues, have Jennifer work with David to ensure the product meets European user expectations, and reconvene next week to check progress.",
+    "default": "Based on the meeting transcript, the team discussed Q1 results and European market expansion plans. They identified issues with payment integration that will delay the launch by two weeks. Each team member was assigned specific action items to prepare for the European market launch."
+}
+
+def fallback_answer(question: str) -> str:
+    """
+    Pick the canned answer for a question, used in demo mode and when OpenAI is unavailable
     
-    messages = [
-        {"role": "system", "content": "You are an assistant that helps answer questions about meeting transcripts. You have access to the full transcript and can provide specific information from it."}
-    ]
+    Args:
+        question: The user's question
+        
+    Returns:
+        The mock answer for the question's keyword category
+    """
+    return mock_answers[classify_question(question)]
+
+_CHAT_SYSTEM_MESSAGE = {"role": "system", "content": "You are an assistant that helps answer questions about meeting transcripts. You have access to the full transcript and can provide specific information from it."}
+_CHAT_PROMPT_PREFIX = """
+        Based on the following meeting transcript, please answer this question: """
+_CHAT_PROMPT_MIDDLE = """
+        
+        Meeting Transcript:
+        """
+_CHAT_PROMPT_SUFFIX = """
+        """
+
+def build_chat_payload(transcript: str, question: str, chat_history: List[Dict[str, str]]) -> Dict[str, Any]:
+    messages = [_CHAT_SYSTEM_MESSAGE]
     
     for message in chat_history:
         messages.append({
@@ -415,84 +686,84 @@ def handle_chat(transcript: str, question: str, chat_history: List[Dict[str, str
     
     messages.append({
         "role": "user",
-        "content": f"""
-        Based on the following meeting transcript, please answer this question: {question}
-        
-        Meeting Transcript:
-        {transcript}
-        """
+        "content": _CHAT_PROMPT_PREFIX + question + _CHAT_PROMPT_MIDDLE + transcript + _CHAT_PROMPT_SUFFIX
     })
     
-    try:
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_key}"
-        }
+    return {
+        "model": "gpt-4",
+        "messages": messages,
+        "temperature": 0.5,
+        "max_tokens": 500
+    }
+
+@cached(endpoint="chat")
+async def handle_chat(transcript: str, question: str, chat_history: List[Dict[str, str]]) -> Dict[str, Any]:
+    """
+    Handle follow-up questions about the meeting
+    
+    Args:
+        transcript: The meeting transcript text
+        question: The user's question
+        chat_history: List of previous messages
         
-        payload = {
-            "model": "gpt-4",
-            "messages": messages,
-            "temperature": 0.5,
-            "max_tokens": 500
-        }
+    Returns:
+        Dictionary containing the AI's response
+    """
+    try:
+        payload = build_chat_payload(transcript, question, chat_history)
         
-        response = requests.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers=headers,
-            json=payload
-        )
+        response = await openai_pool.submit(payload)
         
         if response.status_code == 200:
-            response_json = response.json()
+            response_json = orjson.loads(response.content)
             answer = response_json["choices"][0]["message"]["content"]
             
             return {
                 "answer": answer,
                 "status": "success"
             }
-        else:
-            print(f"API request failed with status code {response.status_code}: {response.text}")
-            
-            answer = ""
-            question_lower = question.lower()
-            
-            if "payment" in question_lower or "integration" in question_lower:
-                answer = mock_answers["payment"]
-            elif "market" in question_lower or "research" in question_lower:
-                answer = mock_answers["market"]
-            elif "concern" in question_lower or "worry" in question_lower or "issue" in question_lower:
-                answer = mock_answers["concern"]
-            elif "action" in question_lower or "task" in question_lower or "assign" in question_lower:
-                answer = mock_answers["action"]
-            elif "decision" in question_lower or "decide" in question_lower:
-                answer = mock_answers["decision"]
-            else:
-                answer = mock_answers["default"]
-                
-            return {
-                "answer": answer,
-                "status": "success"
-            }
+        
+        print(f"API request failed with status code {response.status_code}: {response.text}")
     except Exception as e:
         print(f"Exception occurred: {str(e)}")
+    
+    return {
+        "answer": fallback_answer(question),
+        "status": "fallback"
+    }
+
+async def stream_chat(transcript: str, question: str, chat_history: List[Dict[str, str]]) -> AsyncIterator[Dict[str, str]]:
+    """
+    Stream the answer to a follow-up question as it is generated
+    
+    Args:
+        transcript: The meeting transcript text
+        question: The user's question
+        chat_history: List of previous messages
         
-        answer = ""
-        question_lower = question.lower()
-        
-        if "payment" in question_lower or "integration" in question_lower:
-            answer = mock_answers["payment"]
-        elif "market" in question_lower or "research" in question_lower:
-            answer = mock_answers["market"]
-        elif "concern" in question_lower or "worry" in question_lower or "issue" in question_lower:
-            answer = mock_answers["concern"]
-        elif "action" in question_lower or "task" in question_lower or "assign" in question_lower:
-            answer = mock_answers["action"]
-        elif "decision" in question_lower or "decide" in question_lower:
-            answer = mock_answers["decision"]
+    Yields:
+        {"content": ...} events with consecutive pieces of the answer. When
+        OpenAI is unavailable the canned answer comes as one event marked
+        "status": "fallback"; if the stream breaks midway, a final
+        {"error": ...} event says the answer is incomplete
+    """
+    cached_answer = get_result("chat", transcript, question, chat_history)
+    if cached_answer is not None:
+        yield {"content": cached_answer["answer"]}
+        return
+    
+    answer = []
+    try:
+        async for content in openai_pool.stream(build_chat_payload(transcript, question, chat_history)):
+            answer.append(content)
+            yield {"content": content}
+    except Exception as e:
+        print(f"Exception occurred: {str(e)}")
+        if answer:
+            yield {"error": "The answer was interrupted. Please ask again."}
         else:
-            answer = mock_answers["default"]
-            
-        return {
-            "answer": answer,
-            "status": "success"
-        }
+            yield {"content": fallback_answer(question), "status": "fallback"}
+        return
+    
+    # Only the complete answer is cached, so later requests replay it in one piece
+    store_result("chat", {"answer": "".join(answer), "status": "success"}, transcript, question, chat_history)
@@ -43,15 +43,11 @@ document.addEventListener('DOMContentLoaded', () => {
         loadingIndicator.classList.remove('hidden');
 
         try {
-            const [summaryResponse, sentimentResponse, coachResponse] = await Promise.all([
-                fetchSummary(transcript),
-                fetchSentiment(transcript),
-                fetchCoachFeedback(transcript)
-            ]);
+            const analysis = await fetchAnalysis(transcript);
 
-            displaySummary(summaryResponse);
-            displaySentiment(sentimentResponse);
-            displayCoachFeedback(coachResponse);
+            displaySummary(analysis);
+            displaySentiment(analysis);
+            displayCoachFeedback(analysis);
 
             resultsSection.classList.remove('hidden');
 
@@ -84,9 +80,12 @@ document.addEventListener('DOMContentLoaded', () => {
             });
 
             let answer = "";
+            let messageDiv = null;
+            // Fallback or interrupted answers are shown but kept out of the chat history
+            let complete = true;
             
             try {
-                const response = await fetch(`${API_BASE_URL}/chat`, {
+                const response = await fetch(`${API_BASE_URL}/chat-stream`, {
                     method: 'POST',
                     headers: {
                         'Content-Type': 'application/json'
@@ -98,14 +97,45 @@ document.addEventListener('DOMContentLoaded', () => {
                     })
                 });
 
-                if (!response.ok) {
+                if (!response.ok || !response.body) {
                     throw new Error('Failed to get response');
                 }
 
-                const data = await response.json();
-                answer = data.answer;
+                // Render the answer as server-sent events arrive instead of waiting for the full completion
+                const reader = response.body.getReader();
+                const decoder = new TextDecoder();
+                let buffer = '';
+                while (true) {
+                    const { value, done } = await reader.read();
+                    if (done) break;
+
+                    buffer += decoder.decode(value, { stream: true });
+                    const events = buffer.split('\n\n');
+                    buffer = events.pop();
+                    for (const event of events) {
+                        const data = event.replace(/^data: /, '');
+                        if (data === '[DONE]') continue;
+
+                        const payload = JSON.parse(data);
+                        if (payload.error) {
+                            complete = false;
+                            answer += `\n\n(${payload.error})`;
+                        } else {
+                            if (payload.status === 'fallback') complete = false;
+                            answer += payload.content;
+                        }
+                        if (!messageDiv) {
+                            loadingIndicator.classList.add('hidden');
+                            messageDiv = addMessage('ai', answer);
+                        } else {
+                            messageDiv.textContent = answer;
+                            chatMessages.scrollTop = chatMessages.scrollHeight;
+                        }
+                    }
+                }
             } catch (error) {
                 console.error('API error:', error);
+                complete = false;
                 answer = "I'm sorry, I couldn't process your question at the moment. Please try again later.";
             }
             
@@ -113,12 +143,21 @@ document.addEventListener('DOMContentLoaded', () => {
                 answer = "I'm sorry, I couldn't generate a specific response to that question. Based on the meeting transcript, the team discussed Q1 results and European market expansion, with David expressing concerns about product readiness. Several action items were assigned to team members for the expansion.";
             }
             
-            addMessage('ai', answer);
+            if (messageDiv) {
+                messageDiv.textContent = answer;
+            } else {
+                addMessage('ai', answer);
+            }
             
-            chatHistory.push({
-                role: 'assistant',
-                content: answer
-            });
+            if (complete) {
+                chatHistory.push({
+                    role: 'assistant',
+                    content: answer
+                });
+            } else {
+                // Drop the unanswered question too, so history keeps alternating roles
+                chatHistory.pop();
+            }
         } catch (error) {
             console.error('Error in chat functionality:', error);
             addMessage('ai', 'Sorry, I encountered an error processing your question. Please try again.');
@@ -140,46 +179,11 @@ document.addEventListener('DOMContentLoaded', () => {
         
         console.log('Message added, container now has', chatMessages.childNodes.length, 'messages');
         chatMessages.scrollTop = chatMessages.scrollHeight;
+        return messageDiv;
     }
 
-    async function fetchSummary(transcript) {
-        const response = await fetch(`${API_BASE_URL}/summarize`, {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json'
-            },
-            body: JSON.stringify({ transcript })
-        });
-
-        if (!response.ok) {
-            throw new Error('Failed to fetch summary');
-        }
-
-        const data = await response.json();
-        console.log('Summary API Response:', data);
-        return data;
-    }
-
-    async function fetchSentiment(transcript) {
-        const response = await fetch(`${API_BASE_URL}/analyze-sentiment`, {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json'
-            },
-            body: JSON.stringify({ transcript })
-        });
-
-        if (!response.ok) {
-            throw new Error('Failed to fetch sentiment analysis');
-        }
-
-        const data = await response.json();
-        console.log('Sentiment API Response:', data);
-        return data;
-    }
-
-    async function fetchCoachFeedback(transcript) {
-        const response = await fetch(`${API_BASE_URL}/coach-feedback`, {
+    async function fetchAnalysis(transcript) {
+        const response = await fetch(`${API_BASE_URL}/analyze`, {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json'
@@ -188,11 +192,11 @@ document.addEventListener('DOMContentLoaded', () => {
         });
 
         if (!response.ok) {
-            throw new Error('Failed to fetch coach feedback');
+            throw new Error('Failed to fetch meeting analysis');
         }
 
         const data = await response.json();
-        console.log('Coach Feedback API Response:', data);
+        console.log('Analysis API Response:', data);
         return data;
     }
 